@@ -91,11 +91,18 @@ const DEFAULT_WEIGHT_MULTIPLIERS = new Map<string, number>([
     ["other|capacitor", 1.2],
 ]);
 
+// Shared by every distillation call that doesn't override a setting. The
+// weight table is only ever read, so it's not copied per call.
+const DEFAULT_CONFIG: Readonly<DistillationConfig> = {
+    proximityRadiusMm: 20.0,
+    weightMultipliers: DEFAULT_WEIGHT_MULTIPLIERS,
+    hierarchical: true,
+};
+
 export function createDefaultConfig(): DistillationConfig {
     return {
-        proximityRadiusMm: 20.0,
+        ...DEFAULT_CONFIG,
         weightMultipliers: new Map(DEFAULT_WEIGHT_MULTIPLIERS),
-        hierarchical: true,
     };
 }
 
@@ -129,8 +136,20 @@ class ConnectivityAnalyzer {
     analyze(schematic: KicadSch, sheetPath: string = "/"): Net[] {
         this.reset();
 
+        // Split out power symbols once instead of re-checking (and
+        // re-lowercasing lib_id) every time the symbols are walked.
+        const symbols: SchematicSymbol[] = [];
+        const powerSymbols: SchematicSymbol[] = [];
+        for (const symbol of schematic.symbols.values()) {
+            if (this.isPowerSymbol(symbol)) {
+                powerSymbols.push(symbol);
+            } else {
+                symbols.push(symbol);
+            }
+        }
+
         // Build pin positions for all symbols
-        const pinPositions = this.buildPinPositions(schematic);
+        const pinPositions = this.buildPinPositions(symbols);
 
         // Process wires - create union-find graph
         this.processWires(schematic.wires);
@@ -149,7 +168,7 @@ class ConnectivityAnalyzer {
         ]);
 
         // Process power symbols (implicit global connections)
-        this.processPowerSymbols(schematic);
+        this.processPowerSymbols(powerSymbols);
 
         // Build nets from connected components
         this.buildNets(pinPositions);
@@ -191,14 +210,12 @@ class ConnectivityAnalyzer {
     }
 
     private buildPinPositions(
-        schematic: KicadSch,
+        symbols: SchematicSymbol[],
     ): Map<string, PinConnection[]> {
         const pinPositions = new Map<string, PinConnection[]>();
 
-        for (const symbol of schematic.symbols.values()) {
-            // Skip power symbols for pin position mapping
-            if (this.isPowerSymbol(symbol)) continue;
-
+        // Power symbols are excluded by the caller
+        for (const symbol of symbols) {
             for (const pin of symbol.unit_pins) {
                 const pos = this.getPinPosition(symbol, pin);
                 const k = this.keyFor(pos.x, pos.y);
@@ -303,32 +320,30 @@ class ConnectivityAnalyzer {
         }
     }
 
-    private processPowerSymbols(schematic: KicadSch): void {
+    private processPowerSymbols(powerSymbols: SchematicSymbol[]): void {
         // Group power symbols by their value (VCC, GND, etc.)
         const powerByValue = new Map<string, string[]>();
 
-        for (const symbol of schematic.symbols.values()) {
-            if (this.isPowerSymbol(symbol)) {
-                const powerValue = symbol.value;
-
-                // Find pin position for this power symbol
-                if (symbol.unit_pins.length > 0) {
-                    const pin = symbol.unit_pins[0]!;
-                    const pos = this.getPinPosition(symbol, pin);
-                    const k = this.keyFor(pos.x, pos.y);
-                    this.find(k);
-
-                    if (!powerByValue.has(powerValue)) {
-                        powerByValue.set(powerValue, []);
-                    }
-                    powerByValue.get(powerValue)!.push(k);
-
-                    // Also add to label roots for net naming
-                    if (!this.labelRootsByText.has(powerValue)) {
-                        this.labelRootsByText.set(powerValue, []);
-                    }
-                    this.labelRootsByText.get(powerValue)!.push(this.find(k));
+        for (const symbol of powerSymbols) {
+            const powerValue = symbol.value;
+
+            // Find pin position for this power symbol
+            if (symbol.unit_pins.length > 0) {
+                const pin = symbol.unit_pins[0]!;
+                const pos = this.getPinPosition(symbol, pin);
+                const k = this.keyFor(pos.x, pos.y);
+                this.find(k);
+
+                if (!powerByValue.has(powerValue)) {
+                    powerByValue.set(powerValue, []);
+                }
+                powerByValue.get(powerValue)!.push(k);
+
+                // Also add to label roots for net naming
+                if (!this.labelRootsByText.has(powerValue)) {
+                    this.labelRootsByText.set(powerValue, []);
                 }
+                this.labelRootsByText.get(powerValue)!.push(this.find(k));
             }
         }
 
@@ -634,7 +649,7 @@ export function distillSchematic(
     config: Partial<DistillationConfig> = {},
 ): DistilledSchematic {
     const cfg: DistillationConfig = {
-        ...createDefaultConfig(),
+        ...DEFAULT_CONFIG,
         ...config,
     };
 
@@ -680,7 +695,7 @@ export function distillHierarchicalSchematics(
     config: Partial<DistillationConfig> = {},
 ): DistilledSchematic {
     const cfg: DistillationConfig = {
-        ...createDefaultConfig(),
+        ...DEFAULT_CONFIG,
         ...config,
         hierarchical: true,
     };
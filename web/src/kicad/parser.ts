@@ -303,6 +303,15 @@ export const P = {
 
 export type Parseable = string | List;
 
+/** Short, bounded description of an expression for log messages */
+function head_name(e: ListOrAtom | undefined): string {
+    if (!Array.isArray(e)) {
+        return `${e}`;
+    }
+    const head = e.at(0);
+    return Array.isArray(head) ? "(...)" : `(${head} ...)`;
+}
+
 export function parse_expr(expr: string | List, ...defs: PropertyDefinition[]) {
     if (is_string(expr)) {
         log.info(`Parsing expression with ${expr.length} chars`);
@@ -330,6 +339,11 @@ export function parse_expr(expr: string | List, ...defs: PropertyDefinition[]) {
         }
     }
 
+    // Kept unsliced so warnings can name the expression by its head token.
+    // Logging the expression itself would stringify (or, as a console
+    // argument, keep alive) the whole parsed tree for every unknown token.
+    const whole = expr;
+
     if (start_def) {
         const acceptable_start_strings = as_array(start_def.name);
         const first = expr.at(0) as string;
@@ -360,7 +374,7 @@ export function parse_expr(expr: string | List, ...defs: PropertyDefinition[]) {
 
             if (!def) {
                 log.warn(
-                    `no def for bare element ${element} at position ${n} in expression ${expr}`,
+                    `no def for bare element ${element} at position ${n} in expression ${head_name(whole)}`,
                 );
                 continue;
             }
@@ -375,7 +389,7 @@ export function parse_expr(expr: string | List, ...defs: PropertyDefinition[]) {
 
         if (!def) {
             log.warn(
-                `No def found for element ${element} in expression ${expr}`,
+                `No def found for element ${head_name(element)} in expression ${head_name(whole)}`,
             );
             continue;
         }
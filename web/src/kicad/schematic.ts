@@ -80,6 +80,9 @@ export class KicadSch {
     symbol_instances?: SymbolInstances;
     sheets: SchematicSheet[] = [];
 
+    #symbols_by_reference: Map<string, SchematicSymbol> | undefined;
+    #sheets_by_uuid: Map<string, SchematicSheet> | undefined;
+
     constructor(
         public filename: string,
         expr: Parseable,
@@ -140,6 +143,9 @@ export class KicadSch {
         // See SCH_SHEET_LIST::UpdateSymbolInstanceData
         path ??= ``;
 
+        // References may change below, so the lookup table has to be rebuilt.
+        this.#symbols_by_reference = undefined;
+
         const root_symbol_instances = (
             this.project?.root_schematic_page?.document as KicadSch
         )?.symbol_instances;
@@ -210,21 +216,33 @@ export class KicadSch {
         if (this.symbols.has(uuid_or_ref)) {
             return this.symbols.get(uuid_or_ref)!;
         }
-        for (const sym of this.symbols.values()) {
-            if (sym.uuid == uuid_or_ref || sym.reference == uuid_or_ref) {
-                return sym;
+        return this.#get_symbols_by_reference().get(uuid_or_ref) ?? null;
+    }
+
+    #get_symbols_by_reference() {
+        if (!this.#symbols_by_reference) {
+            this.#symbols_by_reference = new Map();
+            // Units of a multi-unit symbol share a reference, the first one
+            // wins.
+            for (const sym of this.symbols.values()) {
+                if (!this.#symbols_by_reference.has(sym.reference)) {
+                    this.#symbols_by_reference.set(sym.reference, sym);
+                }
             }
         }
-        return null;
+        return this.#symbols_by_reference;
     }
 
     find_sheet(uuid: string) {
-        for (const sheet of this.sheets) {
-            if (sheet.uuid == uuid) {
-                return sheet;
+        if (!this.#sheets_by_uuid) {
+            this.#sheets_by_uuid = new Map();
+            for (const sheet of this.sheets) {
+                if (!this.#sheets_by_uuid.has(sheet.uuid)) {
+                    this.#sheets_by_uuid.set(sheet.uuid, sheet);
+                }
             }
         }
-        return null;
+        return this.#sheets_by_uuid.get(uuid) ?? null;
     }
 
     resolve_text_var(name: string): string | undefined {
@@ -822,6 +840,8 @@ export class LibSymbol {
 
     #pins_by_number: Map<string, PinDefinition> = new Map();
     #properties_by_id: Map<number, Property> = new Map();
+    #unit = 0;
+    #style = 0;
 
     constructor(
         expr: Parseable,
@@ -863,6 +883,16 @@ export class LibSymbol {
             ),
         );
 
+        // KiCAD encodes the symbol unit and body style into the name, for
+        // example, MCP6001_1_2 is unit 1 in the alternate body style. These
+        // are checked on every pin lookup and unit draw, so parse them once.
+        // See SCH_SEXPR_PARSER::ParseSymbol.
+        const name_parts = this.name.split("_");
+        if (name_parts.length >= 3) {
+            this.#unit = parseInt(name_parts.at(-2)!, 10);
+            this.#style = parseInt(name_parts.at(-1)!, 10);
+        }
+
         for (const pin of this.pins) {
             this.#pins_by_number.set(pin.number.text, pin);
         }
@@ -957,13 +987,7 @@ export class LibSymbol {
         // KiCAD encodes the symbol unit into the name, for example,
         // MCP6001_1_1 is unit 1 and MCP6001_2_1 is unit 2.
         // Unit 0 is common to all units.
-        // See SCH_SEXPR_PARSER::ParseSymbol.
-        const parts = this.name.split("_");
-        if (parts.length < 3) {
-            return 0;
-        }
-
-        return parseInt(parts.at(-2)!, 10);
+        return this.#unit;
     }
 
     get style(): number {
@@ -971,13 +995,7 @@ export class LibSymbol {
         // than one at the end of the symbol name.
         // MCP6001_1_1 is the normal body and and MCP6001_1_2 is the alt style.
         // Style 0 is common to all styles.
-        // See SCH_SEXPR_PARSER::ParseSymbol.
-        const parts = this.name.split("_");
-        if (parts.length < 3) {
-            return 0;
-        }
-
-        return parseInt(parts.at(-1)!, 10);
+        return this.#style;
     }
 
     get description(): string {
@@ -23,12 +23,31 @@ export interface DistillResult {
     net_count: number;
 }
 
+/** Default number of repo/commit results kept in memory */
+const DEFAULT_MAX_CACHE_ENTRIES = 16;
+
 /**
  * Service for distilling KiCAD schematics in the browser.
  * Fetches schematic files from GitHub and processes them locally.
  */
 export class SchematicDistillService {
+    // Map iteration order doubles as recency order: oldest entries first.
     private cache = new Map<string, DistillResult>();
+    private cacheHits = 0;
+    private cacheMisses = 0;
+
+    /**
+     * @param maxCacheEntries - Number of results to keep before evicting the
+     *  least recently used one, must be at least 1
+     */
+    constructor(private maxCacheEntries = DEFAULT_MAX_CACHE_ENTRIES) {
+        // Written so that NaN is rejected too.
+        if (!(maxCacheEntries >= 1)) {
+            throw new Error(
+                `maxCacheEntries must be at least 1, got ${maxCacheEntries}`,
+            );
+        }
+    }
 
     /**
      * Generate a cache key for a repo/commit combination
@@ -54,10 +73,13 @@ export class SchematicDistillService {
         const key = this.cacheKey(repo, commit);
 
         // Return cached result if available
-        if (this.cache.has(key)) {
+        const cached = this.touch(key);
+        if (cached) {
+            this.cacheHits++;
             console.log(`[DistillService] Cache hit for ${key}`);
-            return this.cache.get(key)!;
+            return cached;
         }
+        this.cacheMisses++;
 
         console.log(
             `[DistillService] Distilling ${repo}@${commit.slice(0, 8)}`,
@@ -125,8 +147,11 @@ export class SchematicDistillService {
             net_count: Object.keys(distilled.nets).length,
         };
 
-        // Cache the result
+        // Cache the result, dropping the least recently used entries
         this.cache.set(key, result);
+        while (this.cache.size > this.maxCacheEntries) {
+            this.cache.delete(this.cache.keys().next().value!);
+        }
 
         console.log(
             `[DistillService] Complete: ${result.component_count} components, ${result.net_count} nets`,
@@ -179,7 +204,31 @@ export class SchematicDistillService {
      * Get cached result if available
      */
     getCached(repo: string, commit: string): DistillResult | null {
-        return this.cache.get(this.cacheKey(repo, commit)) ?? null;
+        return this.touch(this.cacheKey(repo, commit)) ?? null;
+    }
+
+    /**
+     * Get cache hit/miss counts for distillRepository() and the current size.
+     * The counts cover every repo and are only reset by clearAllCache().
+     */
+    getCacheStatistics(): { hits: number; misses: number; size: number } {
+        return {
+            hits: this.cacheHits,
+            misses: this.cacheMisses,
+            size: this.cache.size,
+        };
+    }
+
+    /**
+     * Look up a cached result and mark it as most recently used
+     */
+    private touch(key: string): DistillResult | undefined {
+        const result = this.cache.get(key);
+        if (result) {
+            this.cache.delete(key);
+            this.cache.set(key, result);
+        }
+        return result;
     }
 
     /**
@@ -199,10 +248,12 @@ export class SchematicDistillService {
     }
 
     /**
-     * Clear the entire cache
+     * Clear the entire cache and reset the hit/miss counts
      */
     clearAllCache(): void {
         this.cache.clear();
+        this.cacheHits = 0;
+        this.cacheMisses = 0;
     }
 }
 
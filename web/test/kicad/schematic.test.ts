@@ -15,6 +15,7 @@ import labels_sch_src from "./files/labels.kicad_sch";
 import drawings_sch_src from "./files/drawings.kicad_sch";
 import symbols_sch_src from "./files/symbols.kicad_sch";
 import symbols_kicad8_sch_src from "./files/symbols_kicad8.kicad_sch";
+import sheets_sch_src from "./files/sheets.kicad_sch";
 
 suite("kicad.schematic.KicadSch(): schematic parsing", function () {
     test("with empty schematic file", function () {
@@ -501,6 +502,19 @@ suite("kicad.schematic.KicadSch(): schematic parsing", function () {
         });
     });
 
+    test("library symbol unit and style from name", function () {
+        const sch = new schematic.KicadSch("test.kicad_sch", symbols_sch_src);
+        const [c_0_1, c_1_1] = sch.lib_symbols!.symbols[0]!.children;
+
+        assert.equal(c_0_1!.name, "C_0_1");
+        assert.equal(c_0_1!.unit, 0);
+        assert.equal(c_0_1!.style, 1);
+
+        assert.equal(c_1_1!.name, "C_1_1");
+        assert.equal(c_1_1!.unit, 1);
+        assert.equal(c_1_1!.style, 1);
+    });
+
     test("with symbols", function () {
         const sch = new schematic.KicadSch("test.kicad_sch", symbols_sch_src);
 
@@ -566,6 +580,52 @@ suite("kicad.schematic.KicadSch(): schematic parsing", function () {
         });
     });
 
+    test("find_symbol() by uuid and reference", function () {
+        const sch = new schematic.KicadSch("test.kicad_sch", symbols_sch_src);
+
+        const c1 = sch.find_symbol("5f300862-b701-480a-8693-9803c387036a");
+        assert.equal(c1?.reference, "C1");
+        assert.strictEqual(sch.find_symbol("C1"), c1);
+        assert.equal(sch.find_symbol("C2")?.lib_id, "Device:C_Polarized_US");
+        assert.isNull(sch.find_symbol("R1"));
+    });
+
+    test("find_symbol() after references are reassigned", function () {
+        const sch = new schematic.KicadSch("test.kicad_sch", symbols_sch_src);
+
+        // Look up by reference first so the reference index is built.
+        const c1 = sch.find_symbol("C1")!;
+        assert.equal(c1.uuid, "5f300862-b701-480a-8693-9803c387036a");
+
+        const inst = new schematic.SchematicSymbolInstance();
+        inst.path = "/other";
+        inst.reference = "C10";
+        c1.instances.set(inst.path, inst);
+        sch.update_hierarchical_data("/other");
+
+        assert.isNull(sch.find_symbol("C1"));
+        assert.strictEqual(sch.find_symbol("C10"), c1);
+    });
+
+    test("find_sheet() by uuid", function () {
+        const sch = new schematic.KicadSch("test.kicad_sch", sheets_sch_src);
+        const uuid = "8f2d7e41-1a9b-4c3e-b6f2-7d4e9a0c5b22";
+
+        const sheet = sch.find_sheet(uuid)!;
+        assert.equal(sheet.uuid, uuid);
+        assert.equal(sheet.sheetname, "MCU");
+        assert.equal(sheet.sheetfile, "mcu.kicad_sch");
+
+        // The second lookup is served from the index.
+        assert.strictEqual(sch.find_sheet(uuid), sheet);
+        assert.strictEqual(
+            sch.find_sheet("0c6a3b35-64c4-4b8a-8a5e-5f0b3c6d2e11"),
+            sch.sheets[0],
+        );
+
+        assert.isNull(sch.find_sheet("nope"));
+    });
+
     // check the KiCad8 symbol attributes
     test("with KiCad8 exclude_from_sim attribute", function () {
         const sch = new schematic.KicadSch(
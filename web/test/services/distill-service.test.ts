@@ -0,0 +1,88 @@
+/*
+    Copyright (c) 2023 Alethea Katherine Flowers.
+    Published under the standard MIT License.
+    Full text available at: https://opensource.org/licenses/MIT
+*/
+
+import { assert } from "@esm-bundle/chai";
+import { SchematicDistillService } from "../../src/kicanvas/services/distill-service";
+import { GitService } from "../../src/kicanvas/services/git-service";
+
+import empty_sch_src from "../kicad/files/empty.kicad_sch";
+
+const repo = "owner/repo";
+
+suite("services.SchematicDistillService: result cache", function () {
+    const get_schematic_files = GitService.getSchematicFiles;
+
+    setup(function () {
+        GitService.getSchematicFiles = async () => [
+            { path: "root.kicad_sch", content: empty_sch_src },
+        ];
+    });
+
+    teardown(function () {
+        GitService.getSchematicFiles = get_schematic_files;
+    });
+
+    test("evicts the least recently used result", async function () {
+        const service = new SchematicDistillService(2);
+
+        await service.distillRepository(repo, "a");
+        await service.distillRepository(repo, "b");
+        await service.distillRepository(repo, "c");
+
+        assert.isFalse(service.isCached(repo, "a"));
+        assert.isTrue(service.isCached(repo, "b"));
+        assert.isTrue(service.isCached(repo, "c"));
+    });
+
+    test("hits and getCached() refresh an entry", async function () {
+        const service = new SchematicDistillService(2);
+
+        await service.distillRepository(repo, "a");
+        await service.distillRepository(repo, "b");
+
+        // A hit on "a" makes "b" the oldest entry.
+        await service.distillRepository(repo, "a");
+        await service.distillRepository(repo, "c");
+
+        assert.isTrue(service.isCached(repo, "a"));
+        assert.isFalse(service.isCached(repo, "b"));
+        assert.isTrue(service.isCached(repo, "c"));
+
+        // Reading "a" makes "c" the oldest entry.
+        assert.isNotNull(service.getCached(repo, "a"));
+        await service.distillRepository(repo, "d");
+
+        assert.isTrue(service.isCached(repo, "a"));
+        assert.isFalse(service.isCached(repo, "c"));
+        assert.isTrue(service.isCached(repo, "d"));
+    });
+
+    test("counts hits and misses", async function () {
+        const service = new SchematicDistillService(2);
+
+        await service.distillRepository(repo, "a");
+        await service.distillRepository(repo, "a");
+
+        assert.deepEqual(service.getCacheStatistics(), {
+            hits: 1,
+            misses: 1,
+            size: 1,
+        });
+
+        service.clearAllCache();
+
+        assert.deepEqual(service.getCacheStatistics(), {
+            hits: 0,
+            misses: 0,
+            size: 0,
+        });
+    });
+
+    test("rejects a capacity below one", function () {
+        assert.throws(() => new SchematicDistillService(0));
+        assert.throws(() => new SchematicDistillService(NaN));
+    });
+});